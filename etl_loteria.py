@@ -16,15 +16,27 @@ ETL Loteria (simples, claro e completo)
   * premiacoes(concurso, faixa, descricao, ganhadores, valor)
   * ganhadores(concurso, municipio, uf, ganhadores)
 - Modo --preview para ver contagens, primeiros 5 registros e relatório de nulos
-- Simples: usa apenas stdlib (sqlite3, unicodedata)
+- Simples: usa apenas stdlib (sqlite3, unicodedata); se o orjson estiver
+  instalado, é usado para ler o JSON (bem mais rápido que json.load)
 """
 
 import argparse
+import functools
 import json
+import mmap
+import multiprocessing
+import os
+import re
 import sqlite3
-from datetime import datetime
+import stat
+from datetime import date, datetime
 import unicodedata
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import orjson  # opcional: parser JSON em C
+except ImportError:
+    orjson = None
 
 # -------------------------
 # Dicionário de Estados com Região
@@ -62,19 +74,72 @@ ESTADOS_INFO = {
 
 VALID_UFS = set(ESTADOS_INFO.keys())
 
+# datas nos dois formatos aceitos: yyyy-mm-dd (grupos 1-3) ou dd/mm/yyyy (4-6)
+_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})|(\d{2})/(\d{2})/(\d{4})", re.ASCII)
+
+# um bit por UF: o conjunto de UFs vistas cabe num único int
+UF_BIT = {uf: 1 << i for i, uf in enumerate(sorted(VALID_UFS))}
+
+# busca de qualquer UF válida contida num texto: uma varredura só (regex
+# compilada) em vez de testar "cand in s" para cada uma das 27 UFs
+_UF_RE = re.compile("|".join(sorted(VALID_UFS)))
+
+# ordem das colunas nas tuplas geradas pelo transform (= ordem de insert)
+SORTEIOS_COLS = (
+    "concurso", "loteria", "data", "local",
+    "valorArrecadado", "valorAcumuladoConcurso_0_5",
+    "valorAcumuladoConcursoEspecial", "valorAcumuladoProximoConcurso",
+    "valorEstimadoProximoConcurso",
+)
+DEZENAS_COLS = ("concurso", "posicao", "numero")
+PREMIACOES_COLS = ("concurso", "faixa", "descricao", "ganhadores", "valorPremio")
+GANHADORES_COLS = ("concurso", "municipio", "uf", "ganhadores")
+
+# registros por bloco no transform (unidade de streaming e do modo paralelo)
+TRANSFORM_CHUNK_SIZE = 10000
+
+# linhas por lote de insert/commit no SQLite (padrão de --batch-size)
+BATCH_SIZE = 10000
+
+# tabela de tradução para os acentos comuns em textos brasileiros
+# (um único str.translate em C em vez de NFKD + filtro caractere a caractere)
+ACCENT_MAP = str.maketrans(
+    "áàâãäéèêëíìîïóòôõöúùûüçñÁÀÂÃÄÉÈÊËÍÌÎÏÓÒÔÕÖÚÙÛÜÇÑ",
+    "aaaaaeeeeiiiiooooouuuucnAAAAAEEEEIIIIOOOOOUUUUCN",
+)
+
+# tabela que apaga tudo que não é dígito (Latin-1); usada em normalize_dezenas
+_NON_DIGIT = str.maketrans("", "", "".join(chr(c) for c in range(256) if not chr(c).isdigit()))
+
 # -------------------------
 # Helpers: limpeza e parsing
 # -------------------------
+def strip_accents(s: str) -> str:
+    """Remove acentos; usa NFKD apenas se sobrar algo fora do ACCENT_MAP."""
+    s = s.translate(ACCENT_MAP)
+    if s.isascii():
+        return s
+    s = unicodedata.normalize("NFKD", s)
+    return "".join(ch for ch in s if not unicodedata.combining(ch))
+
 def clean_text(s: Optional[str]) -> Optional[str]:
     """Remove acentos, strip e padroniza maiúsculas/minúsculas (Title case)."""
     if s is None:
         return None
-    s = str(s).strip()
+    # cache chaveado pelo texto: aceita qualquer valor (listas, bools...) e
+    # não confunde True/1/1.0, que seriam a mesma chave no lru_cache
+    return _clean_text(str(s))
+
+@functools.lru_cache(maxsize=4096)
+def _clean_text(s: str) -> Optional[str]:
+    s = s.strip()
     if s == "":
         return None
+    # ASCII puro não tem acentos: pula a normalização NFKD
+    if s.isascii():
+        return " ".join(s.split()).title()
     # remover acentos
-    s = unicodedata.normalize("NFKD", s)
-    s = "".join(ch for ch in s if not unicodedata.combining(ch))
+    s = strip_accents(s)
     # padronizar espaços e capitalização simples
     return " ".join(s.split()).title()
 
@@ -82,7 +147,21 @@ def parse_date_any(value: Optional[str]) -> Optional[str]:
     """Aceita dd/mm/YYYY ou YYYY-mm-dd. Retorna ISO YYYY-mm-dd ou None."""
     if not value:
         return None
-    v = str(value).strip()
+    return _parse_date(str(value))
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date(v: str) -> Optional[str]:
+    v = v.strip()
+    # caminho rápido: yyyy-mm-dd ou dd/mm/yyyy reconhecidos por uma única
+    # regex compilada; a string ISO sai direto dos grupos, sem strptime
+    m = _DATE_RE.fullmatch(v)
+    if m:
+        y, mo, d = m.group(1, 2, 3) if m.group(1) else m.group(6, 5, 4)
+        try:
+            date(int(y), int(mo), int(d))  # valida dia/mês
+        except ValueError:
+            return None
+        return f"{y}-{mo}-{d}"
     # já ISO?
     if "-" in v:
         try:
@@ -112,9 +191,15 @@ def normalize_dezenas(nums: Optional[List[Any]]) -> List[int]:
     for x in nums:
         if x is None:
             continue
-        sx = str(x).strip()
+        # inteiro já limpo (bool também é int, mas vira texto sem dígitos)
+        if type(x) is int and x >= 0:
+            out.append(x)
+            continue
         # extrai dígitos
-        digits = "".join(ch for ch in sx if ch.isdigit())
+        digits = str(x).translate(_NON_DIGIT)
+        if not digits.isascii():
+            # sobrou algo fora do Latin-1: filtra caractere a caractere
+            digits = "".join(ch for ch in digits if ch.isdigit())
         if digits == "":
             continue
         try:
@@ -123,13 +208,30 @@ def normalize_dezenas(nums: Optional[List[Any]]) -> List[int]:
             continue
     return out
 
+def ufs_from_mask(mask: int) -> List[str]:
+    """Lista (ordenada) das UFs cujos bits estão ligados em mask."""
+    return [uf for uf, bit in UF_BIT.items() if mask & bit]
+
+def to_float_safe(v: Any) -> Optional[float]:
+    """Converte para float; None ou valores inválidos viram None."""
+    if v is None:
+        return None
+    try:
+        return float(v)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
 def normalize_uf(uf: Optional[str]) -> Optional[str]:
     """Padroniza UF: retorna 'SP' etc se válido, caso contrário retorna None."""
     if not uf:
         return None
-    s = str(uf).strip().upper()
-    s = unicodedata.normalize("NFKD", s)
-    s = "".join(ch for ch in s if not unicodedata.combining(ch))
+    return _normalize_uf(str(uf))
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_uf(s: str) -> Optional[str]:
+    s = s.strip().upper()
+    if not s.isascii():
+        s = strip_accents(s)
     s = s.replace(".", "").replace(",", "").strip()
     # valores comuns que indicam vazio
     if s in ("", "--", "NA", "N/A", "NULL", "NONE", "0"):
@@ -143,19 +245,42 @@ def normalize_uf(uf: Optional[str]) -> Optional[str]:
     # se tiver 2 letras válidas
     if len(s) == 2 and s in VALID_UFS:
         return s
-    # se tiver mais que 2 e conteúdo válido contido
-    for cand in VALID_UFS:
-        if cand in s:
-            return cand
-    return None
+    # se tiver mais que 2 e conteúdo válido contido (primeira ocorrência)
+    m = _UF_RE.search(s)
+    return m.group() if m else None
 
 # -------------------------
 # Extract
 # -------------------------
+def _load_json(path: str):
+    """Faz o parse do arquivo com orjson se disponível, senão com json da stdlib."""
+    # orjson rejeita NaN/Infinity, que o json da stdlib aceita (e o próprio
+    # json.dump escreve): nesses casos o parse é refeito com o json da stdlib
+    if orjson is not None:
+        with open(path, "rb") as f:
+            st = os.fstat(f.fileno())
+            if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+                # stdin, FIFO, <(curl ...) ou arquivo vazio: não dá para mmap
+                # (nem reabrir o caminho), então lê os bytes uma vez só
+                raw = f.read()
+                try:
+                    return orjson.loads(raw)
+                except orjson.JSONDecodeError:
+                    return json.loads(raw)
+            try:
+                # mmap: o orjson lê direto das páginas do arquivo, sem copiar
+                # tudo para um bytes intermediário
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                        memoryview(mm) as buf:
+                    return orjson.loads(buf)
+            except orjson.JSONDecodeError:
+                pass
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
 def extract(path: str):
     """Lê JSON do caminho; retorna lista de registros (cada registro um dict)."""
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = _load_json(path)
     if isinstance(data, list):
         return data
     if isinstance(data, dict):
@@ -171,21 +296,13 @@ def extract(path: str):
 # -------------------------
 # Transform
 # -------------------------
-def transform(records: List[Dict[str, Any]]):
-    """
-    Transforma registros brutos em conjuntos prontos para inserção:
-    - sorteios: lista de dicts
-    - dezenas: lista de dicts (posicional)
-    - premiacoes: lista de dicts
-    - ganhadores: lista de dicts
-    - estados_set: set de UFs válidos (para popular tabela estados)
-    Também calcula contagem de nulos por coluna para relatório.
-    """
+def _transform_chunk(records: List[Dict[str, Any]]):
+    """Transforma um bloco de registros (ver transform); roda nos workers."""
     sorteios = []
     dezenas = []
     premiacoes = []
     ganhadores = []
-    estados_set = set()
+    estados_mask = 0
 
     # contadores de nulos por campo (apenas para reporte)
     null_counts = {
@@ -203,6 +320,7 @@ def transform(records: List[Dict[str, Any]]):
             null_counts["concurso_missing"] += 1
             # ignorar registro sem concurso
             continue
+        concurso = int(concurso)
 
         # data
         data_iso = parse_date_any(rec.get("data"))
@@ -215,32 +333,23 @@ def transform(records: List[Dict[str, Any]]):
             null_counts["local_missing"] += 1
 
         # campos numéricos opcionais (vamos incluir alguns numéricos relevantes)
-        def to_float_safe(k):
-            v = rec.get(k)
-            try:
-                if v is None:
-                    return None
-                return float(v)
-            except Exception:
-                return None
-
-        valorArrecadado = to_float_safe("valorArrecadado")
-        valorAcumuladoConcurso_0_5 = to_float_safe("valorAcumuladoConcurso_0_5")
-        valorAcumuladoConcursoEspecial = to_float_safe("valorAcumuladoConcursoEspecial")
-        valorAcumuladoProximoConcurso = to_float_safe("valorAcumuladoProximoConcurso")
-        valorEstimadoProximoConcurso = to_float_safe("valorEstimadoProximoConcurso")
-
-        sorteios.append({
-            "concurso": int(concurso),
-            "loteria": clean_text(rec.get("loteria")),
-            "data": data_iso,
-            "local": local,
-            "valorArrecadado": valorArrecadado,
-            "valorAcumuladoConcurso_0_5": valorAcumuladoConcurso_0_5,
-            "valorAcumuladoConcursoEspecial": valorAcumuladoConcursoEspecial,
-            "valorAcumuladoProximoConcurso": valorAcumuladoProximoConcurso,
-            "valorEstimadoProximoConcurso": valorEstimadoProximoConcurso,
-        })
+        valorArrecadado = to_float_safe(rec.get("valorArrecadado"))
+        valorAcumuladoConcurso_0_5 = to_float_safe(rec.get("valorAcumuladoConcurso_0_5"))
+        valorAcumuladoConcursoEspecial = to_float_safe(rec.get("valorAcumuladoConcursoEspecial"))
+        valorAcumuladoProximoConcurso = to_float_safe(rec.get("valorAcumuladoProximoConcurso"))
+        valorEstimadoProximoConcurso = to_float_safe(rec.get("valorEstimadoProximoConcurso"))
+
+        sorteios.append((
+            concurso,
+            clean_text(rec.get("loteria")),
+            data_iso,
+            local,
+            valorArrecadado,
+            valorAcumuladoConcurso_0_5,
+            valorAcumuladoConcursoEspecial,
+            valorAcumuladoProximoConcurso,
+            valorEstimadoProximoConcurso,
+        ))
 
         # dezenas em ordem do sorteio (se existir)
         dez_ordem = rec.get("dezenasOrdemSorteio") or rec.get("dezenas") or []
@@ -248,21 +357,17 @@ def transform(records: List[Dict[str, Any]]):
         if not nums:
             null_counts["dezenas_missing"] += 1
         for pos, num in enumerate(nums, start=1):
-            dezenas.append({
-                "concurso": int(concurso),
-                "posicao": pos,
-                "numero": int(num)
-            })
+            dezenas.append((concurso, pos, num))
 
         # premiacoes (lista)
         for p in rec.get("premiacoes", []) or []:
-            premiacoes.append({
-                "concurso": int(concurso),
-                "faixa": p.get("faixa"),
-                "descricao": clean_text(p.get("descricao")),
-                "ganhadores": p.get("ganhadores"),
-                "valorPremio": (lambda x: float(x) if x is not None else None)(p.get("valorPremio"))
-            })
+            premiacoes.append((
+                concurso,
+                p.get("faixa"),
+                clean_text(p.get("descricao")),
+                p.get("ganhadores"),
+                to_float_safe(p.get("valorPremio"))
+            ))
 
         # localGanhadores -> ganhadores por cidade/uf
         for g in rec.get("localGanhadores", []) or []:
@@ -271,28 +376,144 @@ def transform(records: List[Dict[str, Any]]):
             if uf is None:
                 null_counts["uf_missing"] += 1
             else:
-                estados_set.add(uf)
-            ganhadores.append({
-                "concurso": int(concurso),
-                "municipio": clean_text(g.get("municipio")),
-                "uf": uf,
-                "ganhadores": g.get("ganhadores")
-            })
+                estados_mask |= UF_BIT[uf]
+            ganhadores.append((
+                concurso,
+                clean_text(g.get("municipio")),
+                uf,
+                g.get("ganhadores")
+            ))
 
-    return sorteios, dezenas, premiacoes, ganhadores, estados_set, null_counts
+    return sorteios, dezenas, premiacoes, ganhadores, estados_mask, null_counts
+
+def transform(records: List[Dict[str, Any]], workers: int = 1):
+    """
+    Transforma registros brutos em conjuntos prontos para inserção:
+    - sorteios: lista de tuplas (colunas em SORTEIOS_COLS)
+    - dezenas: lista de tuplas (colunas em DEZENAS_COLS)
+    - premiacoes: lista de tuplas (colunas em PREMIACOES_COLS)
+    - ganhadores: lista de tuplas (colunas em GANHADORES_COLS)
+    - estados_mask: bitmask das UFs válidas vistas (ver UF_BIT / ufs_from_mask)
+    Também calcula contagem de nulos por coluna para relatório.
+
+    Materializa tudo em memória (usado pelo --preview); a carga no SQLite
+    consome iter_transform diretamente, bloco a bloco.
+    """
+    return _merge_partials(iter_transform(records, workers))
+
+def iter_transform(records: List[Dict[str, Any]], workers: int = 1):
+    """
+    Gera os resultados de _transform_chunk bloco a bloco (ordem preservada),
+    sem acumular as linhas de todos os registros.
+
+    Por padrão roda no próprio processo: com os caches dos helpers, o custo
+    de serializar (pickle) cada bloco para outro processo e trazer o
+    resultado de volta é maior que o próprio transform. workers > 1 usa um
+    multiprocessing.Pool, só se houver mais de um núcleo e mais de um bloco.
+    Feche o gerador (close) se a carga for interrompida, para encerrar o pool.
+    """
+    chunks = [records[i:i + TRANSFORM_CHUNK_SIZE]
+              for i in range(0, len(records), TRANSFORM_CHUNK_SIZE)]
+    workers = min(workers, os.cpu_count() or 1, len(chunks))
+    if workers > 1:
+        with multiprocessing.Pool(workers) as pool:
+            yield from pool.imap(_transform_chunk, chunks)
+        return
+    yield from map(_transform_chunk, chunks)
+
+def _merge_partials(partials):
+    """Concatena os resultados de _transform_chunk na ordem recebida."""
+    sorteios, dezenas, premiacoes, ganhadores = [], [], [], []
+    estados_mask = 0
+    null_counts = {
+        "concurso_missing": 0,
+        "data_missing": 0,
+        "local_missing": 0,
+        "dezenas_missing": 0,
+        "uf_missing": 0,
+    }
+    for s, d, p, g, e, n in partials:
+        sorteios.extend(s)
+        dezenas.extend(d)
+        premiacoes.extend(p)
+        ganhadores.extend(g)
+        estados_mask |= e
+        for k, v in n.items():
+            null_counts[k] += v
+    return sorteios, dezenas, premiacoes, ganhadores, estados_mask, null_counts
 
 # -------------------------
 # Load (SQLite)
 # -------------------------
-def load_sqlite(sqlite_path: str,
-                sorteios: List[Dict[str, Any]],
-                dezenas: List[Dict[str, Any]],
-                premiacoes: List[Dict[str, Any]],
-                ganhadores: List[Dict[str, Any]],
-                estados_set: set):
-    conn = sqlite3.connect(sqlite_path)
+# insert de cada tabela carregada em lotes (tuplas na ordem de *_COLS)
+INSERT_SQL = {
+    # INSERT OR REPLACE para atualizar o sorteio caso já exista
+    "sorteios": """
+    INSERT OR REPLACE INTO sorteios
+    (concurso, loteria, data, local,
+     valorArrecadado, valorAcumuladoConcurso_0_5,
+     valorAcumuladoConcursoEspecial, valorAcumuladoProximoConcurso,
+     valorEstimadoProximoConcurso)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """,
+    "dezenas": "INSERT INTO dezenas (concurso, posicao, numero) VALUES (?, ?, ?)",
+    "premiacoes": "INSERT INTO premiacoes (concurso, faixa, descricao, ganhadores, valorPremio) VALUES (?, ?, ?, ?, ?)",
+    "ganhadores": "INSERT INTO ganhadores (concurso, municipio, uf, ganhadores) VALUES (?, ?, ?, ?)",
+}
+
+def _count_rows(c: sqlite3.Cursor) -> Dict[str, int]:
+    """Quantidade atual de linhas em cada tabela de INSERT_SQL."""
+    return {t: c.execute(f"SELECT COUNT(*) FROM {t}").fetchone()[0] for t in INSERT_SQL}
+
+def _flush(c: sqlite3.Cursor, table: str, rows: List[Tuple]):
+    """Insere um lote em table e o commita, abrindo a próxima transação."""
+    c.executemany(INSERT_SQL[table], rows)
+    c.execute("COMMIT")
+    c.execute("BEGIN")
+
+def load_sqlite(sqlite_path: str, partials: Iterable[Tuple], batch_size: int = BATCH_SIZE):
+    """
+    Carrega no SQLite os blocos gerados por iter_transform, um por vez.
+    Cada tabela é inserida em lotes de batch_size linhas com um commit por
+    lote, para o WAL não crescer sem limite em cargas grandes; as linhas se
+    acumulam entre os blocos do transform até completar o lote. Se a carga
+    falhar no meio, os lotes já commitados ficam no banco (as linhas novas
+    por tabela são informadas) e só o lote em andamento é desfeito.
+    """
+    # isolation_level=None: controlamos a transação manualmente (BEGIN/COMMIT)
+    conn = sqlite3.connect(sqlite_path, isolation_level=None)
     c = conn.cursor()
 
+    # ajustes para carga em lote: WAL + synchronous=NORMAL evitam um fsync
+    # por transação; cache/mmap maiores reduzem I/O durante os inserts
+    c.execute("PRAGMA journal_mode=WAL")
+    c.execute("PRAGMA synchronous=NORMAL")
+    c.execute("PRAGMA temp_store=MEMORY")
+    c.execute("PRAGMA cache_size=-65536")
+    c.execute("PRAGMA mmap_size=268435456")
+
+    # transação controlada manualmente; commits a cada lote (_flush)
+    c.execute("BEGIN")
+    before = None
+    try:
+        _create_tables(c)
+        before = _count_rows(c)
+        _load_tables(c, partials, batch_size)
+        c.execute("COMMIT")
+    except Exception:
+        if conn.in_transaction:
+            c.execute("ROLLBACK")
+        # lotes anteriores já foram commitados e continuam no banco
+        if before is not None:
+            after = _count_rows(c)
+            print("Erro: carga interrompida. Linhas novas já gravadas (não desfeitas): "
+                  + ", ".join(f"{t}={after[t] - before[t]}" for t in INSERT_SQL))
+        raise
+    finally:
+        conn.close()
+
+def _create_tables(c: sqlite3.Cursor):
+    """Cria as tabelas, caso ainda não existam."""
     # criar tabelas
     c.execute("""
     CREATE TABLE IF NOT EXISTS estados (
@@ -318,7 +539,7 @@ def load_sqlite(sqlite_path: str,
 
     c.execute("""
     CREATE TABLE IF NOT EXISTS dezenas (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        id INTEGER PRIMARY KEY,
         concurso INTEGER,
         posicao INTEGER,
         numero INTEGER
@@ -327,7 +548,7 @@ def load_sqlite(sqlite_path: str,
 
     c.execute("""
     CREATE TABLE IF NOT EXISTS premiacoes (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        id INTEGER PRIMARY KEY,
         concurso INTEGER,
         faixa INTEGER,
         descricao TEXT,
@@ -338,7 +559,7 @@ def load_sqlite(sqlite_path: str,
 
     c.execute("""
     CREATE TABLE IF NOT EXISTS ganhadores (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        id INTEGER PRIMARY KEY,
         concurso INTEGER,
         municipio TEXT,
         uf TEXT,
@@ -346,50 +567,34 @@ def load_sqlite(sqlite_path: str,
     );
     """)
 
+def _load_tables(c: sqlite3.Cursor, partials: Iterable[Tuple], batch_size: int):
+    """Insere os blocos do transform em lotes de exatamente batch_size linhas."""
+    buffers = {t: [] for t in INSERT_SQL}
+    estados_mask = 0
+    for sorteios, dezenas, premiacoes, ganhadores, estados, _ in partials:
+        estados_mask |= estados
+        for table, rows in zip(INSERT_SQL, (sorteios, dezenas, premiacoes, ganhadores)):
+            buf = buffers[table]
+            buf.extend(rows)
+            while len(buf) >= batch_size:
+                _flush(c, table, buf[:batch_size])
+                del buf[:batch_size]
+
+    # restos que não completaram um lote
+    for table, buf in buffers.items():
+        if buf:
+            _flush(c, table, buf)
+
     # popular estados (com nome e regiao) — incluir todos os ESTADOS_INFO se quiser,
     # mas vamos inserir apenas os presentes no conjunto para ser conciso.
-    for uf in sorted(estados_set):
-        info = ESTADOS_INFO.get(uf)
-        if info:
-            nome, regiao = info
-        else:
-            nome, regiao = (None, None)
-        c.execute("INSERT OR IGNORE INTO estados (uf, nome_estado, regiao) VALUES (?, ?, ?)",
-                  (uf, nome, regiao))
-
-    # inserir sorteios (usamos INSERT OR REPLACE para atualizar caso já exista)
-    for s in sorteios:
-        c.execute("""
-        INSERT OR REPLACE INTO sorteios
-        (concurso, loteria, data, local,
-         valorArrecadado, valorAcumuladoConcurso_0_5,
-         valorAcumuladoConcursoEspecial, valorAcumuladoProximoConcurso,
-         valorEstimadoProximoConcurso)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            s["concurso"], s.get("loteria"), s.get("data"), s.get("local"),
-            s.get("valorArrecadado"), s.get("valorAcumuladoConcurso_0_5"),
-            s.get("valorAcumuladoConcursoEspecial"), s.get("valorAcumuladoProximoConcurso"),
-            s.get("valorEstimadoProximoConcurso")
-        ))
-
-    # dezenas (executemany em blocos)
-    if dezenas:
-        dezenas_rows = [(d["concurso"], d["posicao"], d["numero"]) for d in dezenas]
-        c.executemany("INSERT INTO dezenas (concurso, posicao, numero) VALUES (?, ?, ?)", dezenas_rows)
-
-    # premiacoes
-    if premiacoes:
-        prem_rows = [(p["concurso"], p.get("faixa"), p.get("descricao"), p.get("ganhadores"), p.get("valorPremio")) for p in premiacoes]
-        c.executemany("INSERT INTO premiacoes (concurso, faixa, descricao, ganhadores, valorPremio) VALUES (?, ?, ?, ?, ?)", prem_rows)
-
-    # ganhadores
-    if ganhadores:
-        ganh_rows = [(g["concurso"], g.get("municipio"), g.get("uf"), g.get("ganhadores")) for g in ganhadores]
-        c.executemany("INSERT INTO ganhadores (concurso, municipio, uf, ganhadores) VALUES (?, ?, ?, ?)", ganh_rows)
+    c.executemany("INSERT OR IGNORE INTO estados (uf, nome_estado, regiao) VALUES (?, ?, ?)",
+                  ((uf, *ESTADOS_INFO.get(uf, (None, None))) for uf in ufs_from_mask(estados_mask)))
 
-    conn.commit()
-    conn.close()
+    # índices por concurso criados só depois da carga (um único build por índice
+    # em vez de manutenção linha a linha durante os inserts)
+    c.execute("CREATE INDEX IF NOT EXISTS idx_dezenas_concurso ON dezenas (concurso)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_premiacoes_concurso ON premiacoes (concurso)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_ganhadores_concurso ON ganhadores (concurso)")
 
 # -------------------------
 # Relatório simples de nulos
@@ -412,35 +617,45 @@ def main():
     parser.add_argument("--input", "-i", required=True, help="arquivo JSON de entrada")
     parser.add_argument("--output", "-o", required=False, help="arquivo SQLite de saída")
     parser.add_argument("--preview", action="store_true", help="apenas mostra resumo e sai")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE,
+                        help=f"linhas por lote de insert/commit no SQLite (padrão: {BATCH_SIZE})")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="processos para o transform (padrão: 1 = serial; "
+                             "só vale para entradas grandes em máquinas com vários núcleos)")
     args = parser.parse_args()
+    if args.batch_size < 1:
+        parser.error("--batch-size deve ser >= 1")
+    if args.workers < 1:
+        parser.error("--workers deve ser >= 1")
 
     records = extract(args.input)
-    sorteios, dezenas, premiacoes, ganhadores, estados_set, null_counts = transform(records)
 
     # Preview: mostrar contagens, primeiros 5 e relatório de nulos
     if args.preview:
+        sorteios, dezenas, premiacoes, ganhadores, estados_mask, null_counts = \
+            transform(records, args.workers)
         print("\n=== PREVIEW ===")
         print(f"Registros originais no arquivo: {len(records)}")
         print(f"Sorteios válidos extraídos: {len(sorteios)}")
         print(f"Dezenas extraídas: {len(dezenas)}")
         print(f"Premiações extraídas: {len(premiacoes)}")
         print(f"Ganhadores extraídos: {len(ganhadores)}")
-        print(f"UFs válidas detectadas (para popular estados): {sorted(estados_set)}")
+        print(f"UFs válidas detectadas (para popular estados): {ufs_from_mask(estados_mask)}")
         report_nulls(null_counts, len(records))
 
         print("\n--- Exemplos (até 5) ---")
         print("Sorteios (primeiros 5):")
         for s in sorteios[:5]:
-            print(s)
+            print(dict(zip(SORTEIOS_COLS, s)))
         print("\nDezenas (primeiros 10):")
         for d in dezenas[:10]:
-            print(d)
+            print(dict(zip(DEZENAS_COLS, d)))
         print("\nPremiacoes (primeiros 5):")
         for p in premiacoes[:5]:
-            print(p)
+            print(dict(zip(PREMIACOES_COLS, p)))
         print("\nGanhadores (primeiros 5):")
         for g in ganhadores[:5]:
-            print(g)
+            print(dict(zip(GANHADORES_COLS, g)))
         print("\n(Use --output <arquivo.db> para salvar no SQLite)\n")
         return
 
@@ -449,8 +664,13 @@ def main():
         print("Erro: use --output para salvar no banco ou --preview para apenas visualizar.")
         return
 
-    # Escrever SQLite
-    load_sqlite(args.output, sorteios, dezenas, premiacoes, ganhadores, estados_set)
+    # Escrever SQLite (transform e load em fluxo, bloco a bloco)
+    partials = iter_transform(records, args.workers)
+    try:
+        load_sqlite(args.output, partials, args.batch_size)
+    finally:
+        # encerra o pool de workers mesmo se a carga falhar no meio
+        partials.close()
     print("ETL concluído com sucesso.")
 
 if __name__ == "__main__":